@@ -1,6 +1,5 @@
 import os
 from re import I
-import pandas as pd
 from io import StringIO
 from typing import List, Dict
 import stat
@@ -11,7 +10,9 @@ from dataclasses import dataclass
 from rich import print
 import rich.repr
 
-@dataclass
+from damply.utils.whose import _pw_lookup
+
+@dataclass(slots=True)
 class DirectoryAudit:
     path: Path
     owner: str
@@ -24,17 +25,7 @@ class DirectoryAudit:
     @classmethod
     def from_path(cls, path: Path) -> 'DirectoryAudit':
       stats = os.stat(path)
-      
-      try:
-        from pwd import getpwuid
-        pwuid_name = getpwuid(stats.st_uid).pw_name
-        pwuid_gecos = getpwuid(stats.st_uid).pw_gecos
-      except ImportError:
-        pwuid_name = "Unknown"
-        pwuid_gecos = "Unknown"
-      except KeyError:
-        pwuid_name = "Unknown"
-        pwuid_gecos = "Unknown"
+      pwuid_name, pwuid_gecos = _pw_lookup(stats.st_uid)
 
       return DirectoryAudit(
         path=path,
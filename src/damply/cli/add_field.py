@@ -2,18 +2,13 @@ import rich_click as click
 from rich import print
 from pathlib import Path
 from damply.metadata import MANDATORY_FIELDS, DMPMetadata
+from damply.cli.click_config import PATH_ANY
 
 @click.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument(
     'path',
-    type=click.Path(
-        exists=True,
-        path_type=Path,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    default=Path().cwd(),
+    type=PATH_ANY,
+    default=Path.cwd,
 )
 @click.argument(
     'field',
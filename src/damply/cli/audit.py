@@ -2,20 +2,14 @@ import rich_click as click
 from rich import print
 from pathlib import Path
 
-from damply.audit import DirectoryAudit
+from damply.cli.click_config import PATH_ANY
 
 
 @click.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument(
     'path',
-    type=click.Path(
-        exists=True,
-        path_type=Path,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    default=Path().cwd(),
+    type=PATH_ANY,
+    default=Path.cwd,
 )
 def audit(path: Path) -> None:
     """Audit the metadata of a valid DMP Directory."""
@@ -23,7 +17,9 @@ def audit(path: Path) -> None:
     print("Auditing DMP Directory...")
     print("[bold red]This has not yet been implemented!!![/bold red]\n\n")
     print("[bold]Here is some summary info of the directory:[/bold]")
-    
+
+    from damply.audit import DirectoryAudit
+
     try:
         audit = DirectoryAudit.from_path(path)
         print(audit)
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import rich_click as click
 
 
@@ -34,3 +36,19 @@ help_config = click.RichHelpConfiguration(
     show_arguments=True,
     option_groups={'damply': [{'name': 'Arguments', 'panel_styles': {'box': 'ASCII'}}]},
 )
+
+# shared parameter types, so each command does not build its own
+PATH_ANY = click.Path(
+    exists=True,
+    path_type=Path,
+    file_okay=True,
+    dir_okay=True,
+    readable=True,
+)
+PATH_DIR = click.Path(
+    exists=True,
+    path_type=Path,
+    file_okay=False,
+    dir_okay=True,
+    readable=True,
+)
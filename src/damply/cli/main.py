@@ -5,13 +5,12 @@ from rich import print
 
 from damply import __version__
 from damply.metadata import MANDATORY_FIELDS, DMPMetadata
-from damply.plot import damplyplot
 from damply.utils import whose as whose_util
 from damply.utils.alias_group import AliasedGroup
 
 from damply.cli.audit import audit
 from damply.cli.plot import plot
-from damply.cli.click_config import help_config
+from damply.cli.click_config import PATH_ANY, PATH_DIR, help_config
 from damply.cli.add_field import add_field
 
 @click.group(
@@ -34,14 +33,8 @@ def cli() -> None:
 @cli.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument(
     'directory',
-    type=click.Path(
-        exists=True,
-        path_type=Path,
-        file_okay=False,
-        dir_okay=True,
-        readable=True,
-    ),
-    default=Path().cwd(),
+    type=PATH_DIR,
+    default=Path.cwd,
 )
 @click.rich_config(help_config=help_config)
 def view(directory: Path) -> None:
@@ -75,14 +68,8 @@ def view(directory: Path) -> None:
 @cli.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument(
     'path',
-    type=click.Path(
-        exists=True,
-        path_type=Path,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    default=Path().cwd(),
+    type=PATH_ANY,
+    default=Path.cwd,
 )
 @click.rich_config(help_config=help_config)
 def whose(path: Path) -> None:
@@ -95,14 +82,8 @@ def whose(path: Path) -> None:
 @cli.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.option(
     '--path',
-    type=click.Path(
-        exists=True,
-        path_type=Path,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    default=Path().cwd(),
+    type=PATH_ANY,
+    default=Path.cwd,
 )
 @click.argument(
     'description',
@@ -130,14 +111,8 @@ def log(description: str, path: Path) -> None:
 )
 @click.argument(
     'path',
-    type=click.Path(
-        exists=True,
-        path_type=Path,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    default=Path().cwd(),
+    type=PATH_ANY,
+    default=Path.cwd,
 )
 @click.rich_config(help_config=help_config)
 def config(path: Path, dry_run: bool) -> None:
@@ -183,14 +158,8 @@ def config(path: Path, dry_run: bool) -> None:
 @cli.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument(
     'path',
-    type=click.Path(
-        exists=True,
-        path_type=Path,
-        file_okay=False,
-        dir_okay=True,
-        readable=True,
-    ),
-    default=Path().cwd(),
+    type=PATH_DIR,
+    default=Path.cwd,
 )
 @click.rich_config(help_config=help_config)
 def init(path: Path) -> None:
@@ -238,14 +207,8 @@ def init(path: Path) -> None:
 @cli.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument(
     'path',
-    type=click.Path(
-        exists=True,
-        path_type=Path,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    default=Path().cwd(),
+    type=PATH_ANY,
+    default=Path.cwd,
 )
 def size(path: Path) -> None:
     """Print the size of the directory."""
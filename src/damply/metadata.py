@@ -1,49 +1,207 @@
 from damply.utils import ByteSize
 
 import datetime  # Add this import
-import re
+import io
+import os
 import stat
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-import subprocess
+from functools import partial
 from pathlib import Path
-from typing import Type
+from typing import Collection, Type
 
 import rich.repr
 
 MANDATORY_FIELDS = ['OWNER', 'DATE', 'DESC']
+README_NAMES = ('README.md', 'README.rst', 'README.txt', 'README')
 
+# 'rwxrwxrwx'-style string for each of the 512 possible permission bit patterns
+_PERMISSION_STRINGS = [
+    ''.join(char if mode & (1 << (8 - i)) else '-' for i, char in enumerate('rwxrwxrwx'))
+    for mode in range(0o1000)
+]
 
-def is_file_writable(file_path: Path) -> bool:
-    import os
 
+def _split_field(line: bytes) -> tuple[str, str] | None:
+    """Split a stripped `#NAME: value` README line into its name and value.
+
+    Returns None for any other line. NAME must be uppercase ASCII letters and
+    the value must not be empty.
+    """
+    if not line.startswith(b'#'):
+        return None
+    name, sep, value = line[1:].partition(b': ')
+    if sep and value and name.isalpha() and name.isupper():
+        return name.decode(), value.decode()
+    return None
+
+
+def is_file_writable(file_path: Path) -> bool:
     return file_path.exists() and os.access(file_path, os.W_OK)
 
-def get_directory_size(directory: Path) -> ByteSize:
-    # may raise   subprocess.CalledProcessError
-    result = subprocess.run(['du', '-s', '-B 1', str(directory)], capture_output=True, text=True, check=True)
-    size_ =  ByteSize(int(result.stdout.split()[0])) 
+# Directory names that callers commonly want to leave out of size measurements
+COMMON_SKIP_DIRS = frozenset({'.git', 'node_modules', '.venv', '__pycache__'})
+
+
+class _SeenInodes:
+    """Inodes already counted or walked, shared by the walker threads.
+
+    Used for files with more than one hard link, which `du` counts only once,
+    and, when following symlinks, for directories, where a link back up the
+    tree would otherwise be walked forever.
+    """
+
+    def __init__(self) -> None:
+        self._seen: set[tuple[int, int]] = set()
+        self._lock = threading.Lock()
+
+    def first_visit(self, st: os.stat_result) -> bool:
+        key = (st.st_dev, st.st_ino)
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
+
+def _scan(
+    directory: str,
+    skip: Collection[str],
+    follow_symlinks: bool,
+    linked: _SeenInodes,
+) -> tuple[int, list[os.DirEntry]]:
+    """Return the total size of the files directly in `directory` and its subdirectory entries.
+
+    Files with several hard links are only counted the first time any of their
+    links is seen.
+    """
+    total = 0
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if entry.name not in skip:
+                        subdirs.append(entry)
+                else:
+                    st = entry.stat(follow_symlinks=follow_symlinks)
+                    if st.st_nlink > 1 and not linked.first_visit(st):
+                        continue
+                    total += st.st_size
+            except OSError:
+                continue
+    return total, subdirs
+
+
+def _tree_size(
+    directory: str,
+    skip: Collection[str],
+    follow_symlinks: bool,
+    visited: _SeenInodes | None,
+    linked: _SeenInodes,
+) -> int:
+    """Walk `directory` with an explicit stack, so deep trees cannot overflow the call stack."""
+    total = 0
+    stack = [directory]
+    while stack:
+        try:
+            size, subdirs = _scan(stack.pop(), skip, follow_symlinks, linked)
+        except OSError:
+            continue
+        total += size
+        for entry in subdirs:
+            try:
+                if visited is None or visited.first_visit(entry.stat()):
+                    stack.append(entry.path)
+            except OSError:
+                continue
+    return total
+
+
+def get_directory_size(
+    directory: Path,
+    workers: int = 8,
+    skip: Collection[str] = (),
+    follow_symlinks: bool = False,
+) -> ByteSize:
+    """Sum the apparent size of every file below `directory`.
+
+    Like `du`, a file with several hard links below `directory` is counted once.
+
+    Walks the tree with `os.scandir`, reusing the `DirEntry` type and stat
+    information instead of building a `Path` per entry. Unreadable entries
+    are skipped.
+
+    Each top-level subdirectory is walked in its own thread (up to `workers`
+    at a time); the GIL is released while waiting on scandir/stat, so on
+    network filesystems the walks overlap their metadata round trips.
+
+    Args:
+        directory (Path): the directory to measure
+        workers (int): maximum number of concurrent walker threads
+        skip (Collection[str]): directory names not to descend into at any
+            depth, e.g. `COMMON_SKIP_DIRS`
+        follow_symlinks (bool): count what symlinks point to, walking each
+            directory at most once; by default symlinks are not followed
+    """
+    skip = frozenset(skip)
+    visited = _SeenInodes() if follow_symlinks else None
+    linked = _SeenInodes()
+    total = 0
+    subdirs = []
+    try:
+        if visited is not None:
+            visited.first_visit(os.stat(directory))
+        size, entries = _scan(directory, skip, follow_symlinks, linked)
+        total += size
+        for entry in entries:
+            try:
+                if visited is None or visited.first_visit(entry.stat()):
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+    except OSError:
+        pass
+
+    walk = partial(
+        _tree_size,
+        skip=skip,
+        follow_symlinks=follow_symlinks,
+        visited=visited,
+        linked=linked,
+    )
+    if workers > 1 and len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            total += sum(executor.map(walk, subdirs))
+    else:
+        total += sum(map(walk, subdirs))
+
+    size_ = ByteSize(total)
     print(f"Size in bytes: {size_.B}")
     return size_
 
-@dataclass
+@dataclass(slots=True)
 class DMPMetadata:
     fields: dict = field(default_factory=dict)
     content: str = field(default_factory=str, repr=False)
-    path: Path = field(default=Path().cwd())
+    path: Path = field(default_factory=Path.cwd)
     permissions: str = field(default='---------')
     logs: list = field(default_factory=list, repr=True)
-    readme: Path = field(default=Path().cwd() / 'README')
+    readme: Path = field(default_factory=lambda: Path.cwd() / 'README')
     size: ByteSize = field(default=None, repr=False)
     size_measured_at: datetime.datetime = field(default=None, repr=False)
 
 
     @classmethod
     def from_path(cls: Type['DMPMetadata'], path: Path) -> 'DMPMetadata':
-        readme: Path = cls._find_readme(path)
+        """Load the metadata from a README file or a directory containing one."""
+        readme, readme_st = cls._find_readme(path, os.stat(path))
 
         metadata = cls()
         metadata.path = readme.resolve().parent
-        metadata.permissions = cls.evaluate_permissions(readme)
+        metadata.permissions = cls.evaluate_permissions(readme, readme_st)
         metadata.readme = readme
         if not metadata.is_readable():
             raise PermissionError(f'{readme} is not readable: {metadata.permissions}')
@@ -55,23 +213,40 @@ class DMPMetadata:
         return metadata
 
     @staticmethod
-    def _find_readme(path: Path) -> Path:
-        if path.is_dir():
-            readmes = [f for f in path.glob('README*') if f.is_file()]
-            if len(readmes) == 0:
-                raise ValueError('No README file found.')
-            elif len(readmes) > 1:
-                print('Multiple README files found. Using the first one.')
-                readme = readmes[0]
+    def _find_readme(path: Path, st: os.stat_result) -> tuple[Path, os.stat_result | None]:
+        readme_st = None
+        if stat.S_ISDIR(st.st_mode):
+            # check the common names directly before listing the whole directory
+            for candidate in README_NAMES:
+                readme = path / candidate
+                try:
+                    readme_st = os.stat(readme)
+                except OSError:
+                    continue
+                if stat.S_ISREG(readme_st.st_mode):
+                    break
+                readme_st = None
             else:
-                readme = readmes[0]
+                with os.scandir(path) as it:
+                    readmes = [
+                        Path(entry.path)
+                        for entry in it
+                        if entry.name.startswith('README') and entry.is_file()
+                    ]
+                if len(readmes) == 0:
+                    raise ValueError('No README file found.')
+                elif len(readmes) > 1:
+                    print('Multiple README files found. Using the first one.')
+                    readme = readmes[0]
+                else:
+                    readme = readmes[0]
         else:
-            readme = path
-            
+            readme, readme_st = path, st
+
         if 'README' not in readme.stem.upper():
             raise ValueError('The file is not a README file.')
-        
-        return readme
+
+        return readme, readme_st
 
     def _dirsize(self) -> ByteSize:
         size = get_directory_size(self.path)
@@ -129,35 +304,24 @@ class DMPMetadata:
         if not is_file_writable(newpath):
             raise PermissionError(f'{newpath} is not writable: {self.permissions}')
 
-        # with newpath.open(mode='w') as file:
-        file = newpath.open(mode='w')
+        buffer = io.StringIO()
         for fld, value in self.fields.items():
-            line = f'#{fld}: {value}'
-            if len(line) > 80:
-                # If the line length exceeds 80,
-                # split it into multiple lines without breaking words
-                words = line.split()
-                lines = []
-                current_line = ''
-                for word in words:
-                    if len(current_line) + len(word) + 1 <= 80:
-                        current_line += word + ' '
-                    else:
-                        lines.append(current_line.strip())
-                        current_line = word + ' '
-                if current_line:
-                    lines.append(current_line.strip())
-                file.write('\n'.join(lines))
-            else:
-                file.write(line)
-            file.write('\n\n')
+            # wrap long fields at 80 characters without breaking words
+            buffer.write(
+                textwrap.fill(
+                    f'#{fld}: {value}',
+                    width=80,
+                    break_long_words=False,
+                    break_on_hyphens=False,
+                )
+            )
+            buffer.write('\n\n')
         if self.content:
-            file.write(f'\n{self.content}')
+            buffer.write(f'\n{self.content}')
         if self.logs:
-            file.write('\n\n\n')
-            for log in self.logs:
-                file.write(f'\n{log}')
-        file.close()
+            buffer.write('\n\n\n')
+            buffer.writelines(f'\n{log}' for log in self.logs)
+        newpath.write_text(buffer.getvalue())
 
     def check_fields(self) -> None:
         missing = [fld for fld in MANDATORY_FIELDS if fld not in self.fields]
@@ -165,39 +329,33 @@ class DMPMetadata:
             raise ValueError(f'The following fields are missing: {missing}' f' in {self.readme}')
 
     @classmethod
-    def _parse_readme(
-        cls: Type['DMPMetadata'],
-        readme: Path,
-        pattern: re.Pattern[str] = re.compile(r'^#([A-Z]+): (.+)$'),
-    ) -> dict:
+    def _parse_readme(cls: Type['DMPMetadata'], readme: Path) -> dict:
         current_field = None
         current_value = []
         content_lines = []
         metadata = {}
-        with readme.open(mode='r') as file:
-            for line in file:
-                if line.strip() == '' and current_field:
-                    # End current field on double newline
-                    metadata[current_field] = ' '.join(current_value).strip()
-                    current_field = None
-                    current_value = []
-                else:
-                    match = pattern.match(line.strip())
-                    if match:
-                        if current_field:
-                            metadata[current_field] = ' '.join(current_value).strip()
-                        current_field, current_value = (
-                            match.groups()[0],
-                            [match.groups()[1]],
-                        )
-                    elif current_field:
-                        current_value.append(line.strip())
-                    else:
-                        content_lines.append(line.strip())
-            
-            
-            if current_field:
+        for raw_line in readme.read_bytes().splitlines():
+            line = raw_line.strip()
+            if not line and current_field:
+                # End current field on double newline
                 metadata[current_field] = ' '.join(current_value).strip()
+                current_field = None
+                current_value = []
+                continue
+
+            field_match = _split_field(line)
+            if field_match:
+                if current_field:
+                    metadata[current_field] = ' '.join(current_value).strip()
+                current_field, value = field_match
+                current_value = [value]
+            elif current_field:
+                current_value.append(line.decode())
+            else:
+                content_lines.append(line.decode())
+
+        if current_field:
+            metadata[current_field] = ' '.join(current_value).strip()
 
         metadata['content'] = '\n'.join(content_lines).strip()
         return metadata
@@ -209,22 +367,10 @@ class DMPMetadata:
         self.fields[key] = value
 
     @staticmethod
-    def evaluate_permissions(path: Path) -> str:
-        permissions = path.stat().st_mode
+    def evaluate_permissions(path: Path, st: os.stat_result | None = None) -> str:
+        permissions = (st or path.stat()).st_mode
         is_dir = 'd' if stat.S_ISDIR(permissions) else '-'
-        perm_bits = [
-            (permissions & stat.S_IRUSR, 'r'),
-            (permissions & stat.S_IWUSR, 'w'),
-            (permissions & stat.S_IXUSR, 'x'),
-            (permissions & stat.S_IRGRP, 'r'),
-            (permissions & stat.S_IWGRP, 'w'),
-            (permissions & stat.S_IXGRP, 'x'),
-            (permissions & stat.S_IROTH, 'r'),
-            (permissions & stat.S_IWOTH, 'w'),
-            (permissions & stat.S_IXOTH, 'x'),
-        ]
-        formatted_permissions = is_dir + ''.join(bit[1] if bit[0] else '-' for bit in perm_bits)
-        return formatted_permissions
+        return is_dir + _PERMISSION_STRINGS[permissions & 0o777]
 
     def get_permissions(self) -> str:
         if not self.permissions:
@@ -1,15 +1,20 @@
+import os
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
-from damply.utils import Directory, DirectoryList
-
 """This is a sandbox script to plot a sankey diagram of the dmp"""
 
 MANDATORY_COLUMNS = ['abspath', 'size_GB']
+# sizes are only compared and summed for display, so single precision is plenty
+COLUMN_DTYPES = {'size_GB': 'float32'}
+
+HAS_PYARROW = find_spec('pyarrow') is not None
 
 """
 The input file should contain the mandatory columns and optionally other columns.
@@ -25,28 +30,99 @@ Goal:
 """
 
 
-def permutate_path(path: Path) -> List[Path]:
+def get_common_root(paths: np.ndarray) -> str:
+    """
+    Return the deepest directory shared by all of the given absolute paths
     """
-    Given a path, return all possible paths from the root to the path
+    # every path sorts between the smallest and the largest one, so they all share
+    # the character prefix of those two, and with it their common directory
+    lowest, highest = paths.min(), paths.max()
+    root = os.path.commonpath([lowest, highest])
+
+    # a path that continues the root's last component with a character sorting
+    # before '/' (e.g. /a/b-x against /a/b) lies between them without being below
+    # the root; such paths are exactly the ones between root and root + '/'
+    if np.any((paths > root) & (paths < root.rstrip('/') + '/')):
+        root = os.path.dirname(root)
+    return root
+
+
+def build_tree(
+    paths: Iterable[str], sizes: Iterable[float], common_root: str
+) -> Tuple[List[str], List[int], List[float]]:
     """
-    assert path.is_absolute(), 'The path must be absolute'
+    Build the directory tree below the common root in a single pass over the rows
 
-    nodes = []
-    while path != Path('/'):
-        nodes.append(path)
-        path = path.parent
-    return nodes
+    Returns the nodes with every parent ahead of its children, the index of each
+    node's parent (-1 for the common root) and the size of each node (0 for the
+    directories that have no row of their own)
+    """
+    nodes = [common_root]
+    parent_of = [-1]
+    node_sizes = [0.0]
+    node_to_idx = {common_root: 0}
+    # bound once, as they run for every new directory
+    add_node, add_parent, add_size = nodes.append, parent_of.append, node_sizes.append
+
+    for path, size in zip(paths, sizes):
+        # walk up by separator offsets until reaching a directory already in the
+        # tree; at the latest that is the common root
+        new_nodes = []
+        node, end = path, len(path)
+        while node not in node_to_idx:
+            new_nodes.append(node)
+            end = path.rfind('/', 0, end)
+            node = path[:end] or '/'
+
+        # add the new directories top-down so each parent precedes its children
+        parent = node_to_idx[node]
+        for node in reversed(new_nodes):
+            node_to_idx[node] = len(nodes)
+            add_node(node)
+            add_parent(parent)
+            add_size(0.0)
+            parent = node_to_idx[node]
+
+        node_sizes[node_to_idx[path]] = size
+
+    return nodes, parent_of, node_sizes
+
+
+def read_audit_table(file_path: Path) -> pd.DataFrame:
+    """
+    Read only the mandatory columns of the audit TSV, using the multi-threaded
+    PyArrow parser when pyarrow is installed
+    """
+    header = pd.read_csv(file_path, sep='\t', nrows=0).columns
+    if not all(col in header for col in MANDATORY_COLUMNS):
+        raise ValueError(
+            f"The file must contain the following columns: {', '.join(MANDATORY_COLUMNS)}"
+        )
 
+    if not HAS_PYARROW:
+        return pd.read_csv(file_path, sep='\t', usecols=MANDATORY_COLUMNS, dtype=COLUMN_DTYPES)
+
+    # Arrow-backed columns keep the paths in one string buffer instead of a
+    # Python object per row, and the .str methods then run in Arrow compute
+    return pd.read_csv(
+        file_path,
+        sep='\t',
+        usecols=MANDATORY_COLUMNS,
+        dtype=COLUMN_DTYPES,
+        engine='pyarrow',
+        dtype_backend='pyarrow',
+    )
 
-def generate_node_list(dirlist: DirectoryList) -> List[Path]:
-    common_root = dirlist.common_root
-    nodes = set(permutate_path(common_root))
 
-    for directory in dirlist.directories:
-        nodes.update(permutate_path(directory.directory))
-    # sort the nodes by # of "/" in the path and then alphabetically
-    nodes = sorted(nodes, key=lambda x: (len(x.parts), x))
-    return list(nodes)
+def depth_mask(paths: pd.Series, common_root: str, depth: int) -> np.ndarray:
+    """
+    Return a boolean array marking the paths at most `depth` levels below the common root
+    """
+    # every path lies under the common root, so its separators past the root's
+    # own are its depth below it; no need to slice the root off each path
+    root_separators = common_root.rstrip('/').count('/')
+    depths = paths.str.count('/').to_numpy() - root_separators
+    return depths <= depth
 
 
 def damplyplot(
@@ -54,71 +130,60 @@ def damplyplot(
     threshold_gb: int = 100,
     fig_width: int = 3340,
     fig_height: int = 1440,
-    depth_from_common_root: int = 3,
+    depth_from_common_root: int | None = None,
 ) -> Path:
     """
 
     The goal is to create a sankey diagram of the directories where the source of
     each flow is the parent directory and the target is the child directory with
     the width of the flow being the size of the directory
+
+    Only the directories at most `depth_from_common_root` levels below the common
+    root are plotted when it is given
     """
 
     # Read the file
-    df = pd.read_csv(file_path, sep='\t')
-
-    if not all(col in df.columns for col in MANDATORY_COLUMNS):
-        raise ValueError(
-            f"The file must contain the following columns: {', '.join(MANDATORY_COLUMNS)}"
-        )
-
-    # Filter the dataframe
-    df = df[df['size_GB'] > threshold_gb]
-
-    dirlist: DirectoryList = DirectoryList(
-        directories=[
-            Directory(directory=Path(row['abspath']), size_GB=row['size_GB'])
-            for index, row in df.iterrows()
-        ]
+    df = read_audit_table(file_path)
+
+    # Filter the dataframe with a single boolean mask so it is only copied once;
+    # the common root and the depths only look at the rows above the threshold
+    keep = df['size_GB'].to_numpy() > threshold_gb
+    if not keep.any():
+        raise ValueError(f'No directories in {file_path} are larger than {threshold_gb} GB')
+    large_paths = df['abspath'][keep]
+    common_root = get_common_root(large_paths.to_numpy(dtype=object))
+    if depth_from_common_root is not None:
+        keep[keep] = depth_mask(large_paths, common_root, depth_from_common_root)
+    df = df[keep]
+
+    nodes, parent_of, size_by_idx = build_tree(
+        df['abspath'].tolist(), df['size_GB'].tolist(), common_root
     )
-    nodes = generate_node_list(dirlist)
-
-    links = []
-    for _dir in dirlist:
-        target = nodes.index(_dir.directory)
-        source = nodes.index(_dir.parent)
-        links.append({'source': source, 'target': target, 'value': _dir.size_GB})
-
-    label_with_sizes = []
-    for node in nodes:
-        label = node.name
-        size = dirlist.dir_size_dict().get(node, 0)
 
+    # one link per edge of the tree, from each directory's parent to it; the
+    # values are filled in once the directories without a row have a size
+    link_sources = np.array(parent_of[1:], dtype=np.int32)
+    link_targets = np.arange(1, len(nodes), dtype=np.int32)
+
+    # nodes come after their parents, so one sweep in reverse order sees every
+    # directory's children before it: the ones without a row of their own take
+    # the total of their children, which is then passed up to their parent
+    child_size_sum = [0.0] * len(nodes)
+    label_with_sizes = [''] * len(nodes)
+    for idx in range(len(nodes) - 1, 0, -1):
+        size = size_by_idx[idx]
         if size == 0:
-            children = [child for child in dirlist.directories if child.parent == node]
-            size = sum([child.size_GB for child in children])
+            size = size_by_idx[idx] = child_size_sum[idx]
+        child_size_sum[parent_of[idx]] += size
 
-            # add to dirlist
-            dirlist.directories.append(Directory(directory=node, size_GB=size))
+        label = nodes[idx].rpartition('/')[2]
+        label_with_sizes[idx] = f'{label} ({size:.2f} GB)'
 
-        label_with_sizes.append(f'{label} ({size} GB)')
-
-    nodes_whose_parent_is_common_root = [
-        node for node in nodes if node.parent == dirlist.common_root
-    ]
-
-    # add a link from the common root to the nodes whose parent is the common root
-    common_root_size = sum(
-        [_dir.size_GB for _dir in dirlist.directories if _dir.parent == dirlist.common_root]
-    )
-    for node in nodes_whose_parent_is_common_root:
-        target = nodes.index(node)
-        source = nodes.index(dirlist.common_root)
-        size = dirlist.dir_size_dict().get(node, 0)
-        links.append({'source': source, 'target': target, 'value': size})
+    link_values = np.array(size_by_idx[1:], dtype=np.float32)
+    common_root_size = child_size_sum[0]
 
-    # get the index of the common root so that we can update the label_with_sizes index
-    common_root_index = nodes.index(dirlist.common_root)
-    label_with_sizes[common_root_index] = f'{dirlist.common_root} ({common_root_size} GB)'
+    # build_tree puts the common root first; label it with the total size
+    label_with_sizes[0] = f'{common_root} ({common_root_size:.2f} GB)'
 
     fig_layout = {'width': fig_width, 'height': fig_height}
 
@@ -133,9 +198,9 @@ def damplyplot(
                     'color': 'blue',
                 },
                 link={
-                    'source': [link['source'] for link in links],
-                    'target': [link['target'] for link in links],
-                    'value': [link['value'] for link in links],
+                    'source': link_sources,
+                    'target': link_targets,
+                    'value': link_values,
                 },
                 textfont={'color': 'black', 'size': 20},
             )
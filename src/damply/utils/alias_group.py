@@ -1,3 +1,6 @@
+import bisect
+from itertools import islice, takewhile
+
 import rich_click as click
 
 from click_didyoumean import DYMGroup
@@ -6,12 +9,27 @@ class AliasedGroup(click.RichGroup, DYMGroup):
     command_class = click.RichCommand
     max_suggestions = 3
     cutoff = 0.5
+    _sorted_commands = None
+
+    def add_command(self, cmd, name=None):
+        super().add_command(cmd, name)
+        # invalidate the cached command names
+        self._sorted_commands = None
+
+    def list_commands(self, ctx):
+        if self._sorted_commands is None:
+            # a tuple, so callers cannot change the cached names
+            self._sorted_commands = tuple(super().list_commands(ctx))
+        return self._sorted_commands
 
     def get_command(self, ctx, cmd_name):
         rv = click.Group.get_command(self, ctx, cmd_name)
         if rv is not None:
             return rv
-        matches = [x for x in self.list_commands(ctx) if x.startswith(cmd_name)]
+        # commands are sorted, so every prefix match is contiguous from here
+        commands = self.list_commands(ctx)
+        start = bisect.bisect_left(commands, cmd_name)
+        matches = list(takewhile(lambda x: x.startswith(cmd_name), islice(commands, start, None)))
         if not matches:
             return None
         elif len(matches) == 1:
@@ -25,4 +43,4 @@ class AliasedGroup(click.RichGroup, DYMGroup):
         if cmd is not None:
             return cmd.name, cmd, args
         else:
-            return None, None, args
\ No newline at end of file
+            return None, None, args
@@ -1,32 +1,35 @@
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List
 import os
 
-@dataclass
+@dataclass(slots=True)
 class Directory:
     directory: Path
     size_GB: int
+    parent: Path = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.parent = self.directory.parent
 
     def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
+        return getattr(self, key)
 
     def __repr__(self):
         return f"Directory({self.directory}, {self.size_GB})"
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectoryList:
     directories: List[Directory]
+    common_root: Path = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.common_root = self.get_common_root()
 
     def get_common_root(self) -> Path:
+        # commonpath compares whole path components, unlike commonprefix
         dirs = [directory.directory for directory in self.directories]
         common_path = os.path.commonpath(dirs)
         return Path(common_path)
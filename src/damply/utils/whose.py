@@ -1,29 +1,40 @@
 import os
+import platform
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import pwd
+except ImportError:
+    pwd = None
+
+
+@lru_cache(maxsize=None)
+def _pw_lookup(uid: int) -> tuple[str, str]:
+    """Return the ``(pw_name, pw_gecos)`` of a user ID, cached for the process.
+
+    Most files in a project tree share a handful of owners, so caching avoids
+    repeating the same NSS lookup for every path.
+    """
+    if pwd is None:
+        return "Unknown", "Unknown"
+    try:
+        user_info = pwd.getpwuid(uid)
+    except KeyError:
+        return "Unknown", "Unknown"
+    return user_info.pw_name, user_info.pw_gecos
 
-import os
-from pathlib import Path
-import platform
 
 def get_file_owner_full_name(file_path: Path):
     try:
         if platform.system() == "Windows":
             raise NotImplementedError("Platform not supported for retrieving user info using pwd module.")
-        
-        from pwd import getpwuid
-
-        # Get the file's status
-        file_stat = os.stat(file_path)
 
-        # Get the user ID of the file owner
-        uid = file_stat.st_uid
+        if pwd is None:
+            raise ImportError("Module 'pwd' is not available on this platform.")
 
-        # Get the user information based on the user ID
-        user_info = getpwuid(uid)
-
-        # Return the full name of the user
-        return user_info.pw_gecos
+        # Return the full name of the user that owns the file
+        return _pw_lookup(os.stat(file_path).st_uid)[1]
 
     except ImportError:
         print("Module 'pwd' is not available on this platform.")
@@ -32,4 +43,3 @@ def get_file_owner_full_name(file_path: Path):
         return "Retrieving user info is not supported on Windows."
     except Exception as e:
         return str(e)
-
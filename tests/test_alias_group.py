@@ -0,0 +1,60 @@
+import rich_click as click
+from click.testing import CliRunner
+
+from damply.utils.alias_group import AliasedGroup
+
+
+@click.group(cls=AliasedGroup)
+def cli():
+    pass
+
+
+@cli.command()
+def view():
+    click.echo("view")
+
+
+@cli.command()
+def version():
+    click.echo("version")
+
+
+@cli.command()
+def log():
+    click.echo("log")
+
+
+def test_exact_command():
+    result = CliRunner().invoke(cli, ["log"])
+    assert result.exit_code == 0
+    assert result.output == "log\n"
+
+
+def test_unique_prefix():
+    result = CliRunner().invoke(cli, ["vi"])
+    assert result.exit_code == 0
+    assert result.output == "view\n"
+
+
+def test_ambiguous_prefix():
+    result = CliRunner().invoke(cli, ["v"])
+    assert result.exit_code != 0
+    assert "Too many matches: version, view" in result.output
+
+
+def test_list_commands_refreshes_after_add_command():
+    @click.group(cls=AliasedGroup)
+    def group():
+        pass
+
+    @group.command()
+    def first():
+        pass
+
+    assert group.list_commands(None) == ("first",)
+
+    @group.command()
+    def second():
+        pass
+
+    assert group.list_commands(None) == ("first", "second")
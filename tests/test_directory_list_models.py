@@ -1,4 +1,7 @@
 from pathlib import Path
+
+import pytest
+
 from damply.utils import Directory, DirectoryList
 
 
@@ -29,4 +32,18 @@ def test_directory_list():
         dir1_path: 10,
         dir2_path: 20
     }
-    assert repr(directory_list) == f"CommonPre:{Path('/home/user')}\nDirectory({dir1_path}, 10)\nDirectory({dir2_path}, 20)\n"
\ No newline at end of file
+    assert repr(directory_list) == f"CommonPre:{Path('/home/user')}\nDirectory({dir1_path}, 10)\nDirectory({dir2_path}, 20)\n"
+
+
+def test_directory_list_common_root_is_path_aware():
+    directory_list = DirectoryList(directories=[
+        Directory(directory=Path("/a/foo"), size_GB=10),
+        Directory(directory=Path("/a/foobar"), size_GB=20)
+    ])
+
+    assert directory_list.common_root == Path("/a")
+
+
+def test_directory_list_empty():
+    with pytest.raises(ValueError, match="empty sequence"):
+        DirectoryList(directories=[])
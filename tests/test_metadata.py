@@ -1,6 +1,8 @@
+import sys
+
 import pytest
 from pathlib import Path
-from damply.metadata import DMPMetadata
+from damply.metadata import DMPMetadata, _split_field, get_directory_size
 import datetime  # Add this import
 
 
@@ -11,12 +13,53 @@ def test_from_path_valid_readme():
     assert metadata.fields["DATE"] == "2024-05-30"
     assert metadata.fields["DESC"] == "A simple readme."
 
+def test_from_path_directory():
+    metadata = DMPMetadata.from_path(Path("tests/examples/simple").resolve())
+    assert metadata.readme.name == "README_simple.md"
+    assert metadata.fields["OWNER"] == "Jermiah Joseph"
+
+
+def test_from_path_directory_prefers_readme_md(tmp_path):
+    (tmp_path / "README.md").write_text("#OWNER: Someone\n\n#DATE: 2024-01-01\n")
+    (tmp_path / "README_old.md").write_text("#OWNER: Someone Else\n")
+    metadata = DMPMetadata.from_path(tmp_path)
+    assert metadata.readme == tmp_path / "README.md"
+    assert metadata.fields["OWNER"] == "Someone"
+
+
 def test_from_path_invalid_readme():
     readme_path = Path("tests/examples/invalid_.md").resolve()
     with pytest.raises(ValueError):
         DMPMetadata.from_path(readme_path)
 
 
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (b"#OWNER: Jermiah Joseph", ("OWNER", "Jermiah Joseph")),
+        (b"#DESC: a: b", ("DESC", "a: b")),
+        (b"# OWNER: name", None),
+        (b"#Owner: name", None),
+        (b"#OWNER1: name", None),
+        (b"#OWNER:", None),
+        (b"#OWNER:name", None),
+        (b"OWNER: name", None),
+        (b"## Heading", None),
+    ],
+)
+def test_split_field(line, expected):
+    assert _split_field(line) == expected
+
+
+def test_evaluate_permissions(tmp_path):
+    readme = tmp_path / "README.md"
+    readme.touch()
+    readme.chmod(0o640)
+    assert DMPMetadata.evaluate_permissions(readme) == "-rw-r-----"
+    tmp_path.chmod(0o751)
+    assert DMPMetadata.evaluate_permissions(tmp_path) == "drwxr-x--x"
+
+
 def test_log_change():
     metadata = DMPMetadata()
     metadata.log_change("Added a log entry.")
@@ -30,7 +73,7 @@ def test_log_change():
         assert message.startswith("Added")
 
 
-def test_write_to_file():
+def test_write_to_file(tmp_path):
     metadata = DMPMetadata()
     metadata["FIELD1"] = "value1"
     metadata["FIELD2"] = "value2"
@@ -38,9 +81,7 @@ def test_write_to_file():
     metadata.log_change("Added a log entry.")
     metadata.log_change("Added another log entry.")
 
-    tmpdirname = "tests/examples/"
-
-    newpath = Path(tmpdirname) / "test.dmp"
+    newpath = tmp_path / "test.dmp"
 
     # create the file with all permissions
     newpath.touch()
@@ -56,4 +97,91 @@ def test_write_to_file():
         if i == 2:
             assert line == "#FIELD2: value2"
         if i == 5:
-            assert line == "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
\ No newline at end of file
+            assert line == "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+
+
+def test_write_to_file_wraps_long_fields(tmp_path):
+    desc = " ".join(["word"] * 40)
+    metadata = DMPMetadata(fields={"OWNER": "Someone", "DESC": desc})
+    readme = tmp_path / "README.md"
+    metadata.write_to_file(readme)
+
+    lines = readme.read_text().splitlines()
+    assert all(len(line) <= 80 for line in lines)
+    assert DMPMetadata._parse_readme(readme)["DESC"] == desc
+
+
+def make_size_tree(tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"x" * 100)
+    nested = tmp_path / "sub" / "deeper"
+    nested.mkdir(parents=True)
+    (nested / "b.txt").write_bytes(b"x" * 250)
+    (tmp_path / "link").symlink_to(nested / "b.txt")
+    (tmp_path / "dirlink").symlink_to(nested)
+    return 100 + 250 + len(str(nested / "b.txt")) + len(str(nested))
+
+
+def test_get_directory_size(tmp_path):
+    expected = make_size_tree(tmp_path)
+    assert get_directory_size(tmp_path).B == expected
+
+
+def test_get_directory_size_single_worker(tmp_path):
+    expected = make_size_tree(tmp_path)
+    assert get_directory_size(tmp_path, workers=1).B == expected
+
+
+def test_get_directory_size_skip(tmp_path):
+    (tmp_path / "project").mkdir()
+    expected = make_size_tree(tmp_path / "project")
+    (tmp_path / "project" / ".git").mkdir()
+    (tmp_path / "project" / ".git" / "pack").write_bytes(b"x" * 1000)
+    (tmp_path / "project" / "sub" / ".git").mkdir()
+    (tmp_path / "project" / "sub" / ".git" / "pack").write_bytes(b"x" * 1000)
+
+    assert get_directory_size(tmp_path / "project").B == expected + 2000
+    assert get_directory_size(tmp_path / "project", skip={".git"}).B == expected
+
+
+def test_get_directory_size_follow_symlinks(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "data.bin").write_bytes(b"x" * 500)
+
+    project = tmp_path / "project"
+    (project / "sub").mkdir(parents=True)
+    (project / "a.txt").write_bytes(b"x" * 100)
+    (project / "sub" / "data").symlink_to(outside)
+    # a link back up the tree must not be walked forever
+    (project / "sub" / "loop").symlink_to(project)
+
+    assert get_directory_size(project, follow_symlinks=True).B == 600
+
+
+def test_get_directory_size_counts_hard_links_once(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "data.bin").write_bytes(b"x" * 400)
+    (tmp_path / "b" / "data.bin").hardlink_to(tmp_path / "a" / "data.bin")
+    (tmp_path / "other.bin").write_bytes(b"x" * 50)
+
+    assert get_directory_size(tmp_path).B == 450
+
+
+def test_get_directory_size_deep_tree(tmp_path):
+    deepest = tmp_path.joinpath(*["d"] * 50)
+    deepest.mkdir(parents=True)
+    (deepest / "leaf.txt").write_bytes(b"x" * 10)
+
+    # leave fewer spare frames than the tree has levels, so a walker that
+    # recursed per directory would hit the limit
+    frame, depth = sys._getframe(), 0
+    while frame is not None:
+        frame, depth = frame.f_back, depth + 1
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(depth + 30)
+    try:
+        size = get_directory_size(tmp_path, workers=1)
+    finally:
+        sys.setrecursionlimit(limit)
+    assert size.B == 10
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from damply.plot import (
+    build_tree,
+    damplyplot,
+    depth_mask,
+    get_common_root,
+)
+
+
+@pytest.mark.parametrize(
+    "paths, expected",
+    [
+        (["/a/b/c", "/a/b/d"], "/a/b"),
+        (["/a/b", "/a/b/c"], "/a/b"),
+        (["/a/foo", "/a/foobar"], "/a"),
+        (["/a/b", "/a/b-x", "/a/b/c"], "/a"),
+        (["/a/b", "/a/b/c", "/a/b/d"], "/a/b"),
+        (["/a/b/"], "/a/b"),
+        (["/x", "/y"], "/"),
+    ],
+)
+def test_get_common_root(paths, expected):
+    assert get_common_root(np.array(paths, dtype=object)) == expected
+
+
+def test_build_tree():
+    nodes, parent_of, sizes = build_tree(["/r/a/b", "/r/c", "/r/a"], [2.0, 3.0, 5.0], "/r")
+    assert nodes == ["/r", "/r/a", "/r/a/b", "/r/c"]
+    assert parent_of == [-1, 0, 1, 0]
+    assert sizes == [0.0, 5.0, 2.0, 3.0]
+
+
+def test_build_tree_filesystem_root():
+    nodes, parent_of, _ = build_tree(["/a/b"], [1.0], "/")
+    assert nodes == ["/", "/a", "/a/b"]
+    assert parent_of == [-1, 0, 1]
+
+
+def test_depth_mask():
+    paths = pd.Series(["/root/a", "/root/a/b", "/root/d/e/f"])
+    mask = depth_mask(paths, "/root", 2)
+    assert isinstance(mask, np.ndarray)
+    assert mask.tolist() == [True, True, False]
+
+
+def test_depth_mask_arrow_strings():
+    pytest.importorskip("pyarrow")
+    paths = pd.Series(["/root/a", "/root/a/b", "/root/d"]).convert_dtypes(
+        dtype_backend="pyarrow"
+    )
+    assert depth_mask(paths, "/root", 1).tolist() == [True, False, True]
+
+
+def test_damplyplot_rolls_sizes_up_to_directories_without_rows(tmp_path, monkeypatch):
+    audit = tmp_path / "audit.tsv"
+    audit.write_text(
+        "abspath\tsize_GB\n"
+        "/r/a\t300\n"
+        "/r/a/b\t200\n"
+        "/r/e/f/g\t500\n"
+    )
+    figures = []
+    monkeypatch.setattr(go.Figure, "write_image", lambda fig, *args, **kwargs: figures.append(fig))
+    monkeypatch.chdir(tmp_path)
+
+    damplyplot(audit, threshold_gb=100)
+
+    sankey = figures[0].data[0]
+    labels = list(sankey.node.label)
+    assert labels == [
+        "/r (800.00 GB)",
+        "a (300.00 GB)",
+        "b (200.00 GB)",
+        "e (500.00 GB)",
+        "f (500.00 GB)",
+        "g (500.00 GB)",
+    ]
+    links = sorted(zip(sankey.link.source, sankey.link.target, sankey.link.value))
+    assert links == [(0, 1, 300), (0, 3, 500), (1, 2, 200), (3, 4, 500), (4, 5, 500)]
+
+
+def test_damplyplot_nothing_above_threshold(tmp_path):
+    audit = tmp_path / "audit.tsv"
+    audit.write_text("abspath\tsize_GB\n/r/a\t50\n")
+    with pytest.raises(ValueError, match="larger than 100 GB"):
+        damplyplot(audit, threshold_gb=100)
+
+
+@pytest.mark.parametrize("depth, expected", [(None, 6), (2, 2)])
+def test_damplyplot_depth_from_common_root(tmp_path, monkeypatch, depth, expected):
+    audit = tmp_path / "audit.tsv"
+    audit.write_text("abspath\tsize_GB\n/r/a\t400\n/r/x/b/c/d\t300\n")
+    figures = []
+    monkeypatch.setattr(go.Figure, "write_image", lambda fig, *args, **kwargs: figures.append(fig))
+    monkeypatch.chdir(tmp_path)
+
+    damplyplot(audit, threshold_gb=100, depth_from_common_root=depth)
+
+    assert len(figures[0].data[0].node.label) == expected
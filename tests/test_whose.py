@@ -5,6 +5,13 @@ from pathlib import Path
 from damply.utils import whose
 
 
+@pytest.fixture(autouse=True)
+def clear_pw_cache():
+    whose._pw_lookup.cache_clear()
+    yield
+    whose._pw_lookup.cache_clear()
+
+
 def test_get_file_owner_full_name_unix():
     file_path = Path('/dummy/path')
 
@@ -20,7 +27,7 @@ def test_get_file_owner_full_name_import_error():
     file_path = Path('/dummy/path')
 
     with patch('builtins.print') as mock_print, patch.object(Path, 'owner', return_value='dummy_owner') as mock_owner:
-        with patch.dict('sys.modules', {'pwd': None}):
+        with patch.object(whose, 'pwd', None):
             assert whose.get_file_owner_full_name(file_path) == 'dummy_owner'
             mock_print.assert_called_with("Module 'pwd' is not available on this platform.")
 
@@ -35,3 +42,18 @@ def test_get_file_owner_full_name_exception():
 
     with patch('os.stat', side_effect=Exception('An error occurred')):
         assert whose.get_file_owner_full_name(file_path) == 'An error occurred'
+
+def test_get_file_owner_full_name_caches_lookup():
+    with patch('os.stat') as mock_stat, patch('pwd.getpwuid') as mock_getpwuid, patch('pwd.getpwall') as mock_getpwall:
+        mock_stat.return_value.st_uid = 1000
+        mock_getpwuid.return_value.pw_gecos = 'John Doe'
+
+        assert whose.get_file_owner_full_name(Path('/dummy/a')) == 'John Doe'
+        assert whose.get_file_owner_full_name(Path('/dummy/b')) == 'John Doe'
+        mock_getpwuid.assert_called_once_with(1000)
+        # a single owner lookup must not enumerate the whole password database
+        mock_getpwall.assert_not_called()
+
+def test_pw_lookup_unknown_uid():
+    with patch('pwd.getpwuid', side_effect=KeyError(1000)):
+        assert whose._pw_lookup(1000) == ('Unknown', 'Unknown')